@@ -4,6 +4,8 @@ OpenRouter API client module.
 This module provides a client to interact with models via the OpenRouter.ai API.
 """
 
+import atexit
+import functools
 import os
 import json
 import logging
@@ -13,6 +15,23 @@ from typing import Dict, Any, Optional, List
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _http_session() -> requests.Session:
+    """
+    Return the HTTP session shared by every OpenRouterClient.
+
+    Clients are created freely (e.g. one per ItemGenerator), so the session
+    lives at module level: TCP/TLS connections to OpenRouter are kept alive
+    across all of them instead of per instance. The pool is sized for
+    concurrent callers such as the world generator's thread pool, and the
+    session is closed when the interpreter exits.
+    """
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+    atexit.register(session.close)
+    return session
+
+
 class OpenRouterClient:
     """
     A client to interact with models via the OpenRouter.ai API.
@@ -53,6 +72,7 @@ class OpenRouterClient:
         )  # Fallback model
         self.site_url = site_url
         self.app_name = app_name
+        self.session = _http_session()
 
     def generate_response(
         self,
@@ -124,7 +144,7 @@ class OpenRouterClient:
         payload.update(final_gen_params)
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
@@ -0,0 +1,133 @@
+"""
+AI response cache module.
+
+Two-tier exact-match cache for AI responses: a bounded in-memory LRU in front
+of JSON files stored on disk, keyed by the model and the prompt text.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 dias
+
+
+class ResponseCache:
+    """Caches AI responses by (model, prompt) in memory and on disk."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_memory_entries: int = 1000,
+    ) -> None:
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored as JSON files
+            ttl: Seconds a cached response stays valid
+            max_memory_entries: Maximum number of responses kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        # key -> (created_at, response), least recently used first
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Return the cache key for a model and prompt."""
+        return hashlib.md5(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key: str, created_at: float, response: str) -> None:
+        with self._lock:
+            self._memory[key] = (created_at, response)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            model: Model that produced the response
+            prompt: Prompt text sent to the model
+
+        Returns:
+            The cached response, or None if missing or expired
+        """
+        key = self.make_key(model, prompt)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Error reading cached AI response %s: %s", key, e)
+            return None
+
+        created_at = data.get("created_at", 0.0)
+        if now - created_at >= data.get("ttl", self.ttl):
+            return None
+        response = data.get("response")
+        if not isinstance(response, str):
+            return None
+
+        self._remember(key, created_at, response)
+        return response
+
+    def set(self, model: str, prompt: str, response: str) -> None:
+        """
+        Store a response in memory and on disk.
+
+        Args:
+            model: Model that produced the response
+            prompt: Prompt text sent to the model
+            response: Response text to cache
+        """
+        key = self.make_key(model, prompt)
+        created_at = time.time()
+        self._remember(key, created_at, response)
+
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "prompt_hash": key,
+                        "model": model,
+                        "response": response,
+                        "created_at": created_at,
+                        "ttl": self.ttl,
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Error writing cached AI response %s: %s", key, e)
@@ -76,8 +76,8 @@ sys.path.insert(0, root_dir)
 
 # Não importe 'routes_bp' aqui ainda para evitar importação circular
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the entry point (run_game.py or __main__ below),
+# not at import time, so importing this module leaves the root logger alone.
 logger = logging.getLogger(__name__)
 
 
@@ -535,23 +535,22 @@ class GameApp:
         owner_session_id = session.get("user_id")
 
         if not active_character_id or not owner_session_id:
-            return jsonify({"success": False, "message": "Nenhuma sessão ativa."}), 401
+            return jsonify(ErrorHandler.failure_payload("Nenhuma sessão ativa.")), 401
 
         character, game_state = self._load_character_and_state(active_character_id)
 
         if not character or not game_state:
             return (
                 jsonify(
-                    {
-                        "success": False,
-                        "message": "Personagem ou estado do jogo não encontrado.",
-                    }
+                    ErrorHandler.failure_payload(
+                        "Personagem ou estado do jogo não encontrado."
+                    )
                 ),
                 404,
             )
 
         if character.owner_session_id != owner_session_id:
-            return jsonify({"success": False, "message": "Erro de permissão."}), 403
+            return jsonify(ErrorHandler.failure_payload("Erro de permissão.")), 403
 
         # map.js espera:
         # world_map: { locations: {id: LocationData}, discovered: {"x,y": locId} }
@@ -603,4 +602,5 @@ _game_app_instance.register_app_specific_routes()  # Renamed for clarity
 
 # --- Run the Application ---
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     _game_app_instance.run()
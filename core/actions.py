@@ -1,4 +1,5 @@
 # filepath: c:\Users\rodri\Desktop\REPLIT RPG\core\actions.py
+import functools
 import logging
 import os
 import re  # Importar re para regex
@@ -22,6 +23,15 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+@functools.cache
+def _get_world_generator(data_dir: str) -> WorldGenerator:
+    """Return the shared WorldGenerator for a data directory.
+
+    Reusing one instance keeps its in-memory AI response cache warm across moves.
+    """
+    return WorldGenerator(data_dir)
+
+
 class ActionHandler:
     """
     Base class for action handlers.
@@ -46,7 +56,7 @@ class MoveActionHandler(ActionHandler):
         )
         # Init world generator
         data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-        world_generator = WorldGenerator(data_dir)
+        world_generator = _get_world_generator(data_dir)
 
         destination = details.strip().lower() if isinstance(details, str) else ""
         current_location_id = game_state.location_id
@@ -146,26 +156,30 @@ class MoveActionHandler(ActionHandler):
             game_state.coordinates = next_location["coordinates"].copy()
 
             # Agora é seguro acessar game_state.visited_locations diretamente
-            visited_info = game_state.visited_locations.get(next_location_id)
+            # get_visited completa entradas parciais com os dados do world_map
+            visited_info = game_state.get_visited(next_location_id)
 
             if visited_info and next_location.get(
                 "visited"
             ):  # Checar se o local já foi visitado antes
-                visited_info["last_visited"] = "revisited"
+                game_state.visited_locations[next_location_id][
+                    "last_visited"
+                ] = "revisited"
                 game_state.scene_description = visited_info["description"]
-                game_state.npcs_present = visited_info["npcs_seen"]
+                # Registros guardam tuplas somente leitura; a cena recebe uma lista própria
+                game_state.npcs_present = list(visited_info["npcs_seen"])
                 # Marcar como visitado no world_map também, se não estiver
                 if not game_state.world_map[next_location_id].get("visited"):
                     game_state.world_map[next_location_id]["visited"] = True
-                # Optional: add new events
+                # Optional: add new events (fresh from the AI, not the cache)
                 if random.random() < 0.3:
                     game_state.events = world_generator.generate_events(
-                        next_location["name"], next_location.get("type", "unknown")
+                        next_location["name"],
+                        next_location.get("type", "unknown"),
+                        use_cache=False,
                     )
                 else:
-                    game_state.events = visited_info.get("events_seen", [])
-
-                game_state.visited_locations[next_location_id] = visited_info
+                    game_state.events = list(visited_info.get("events_seen", ()))
 
                 return {
                     "success": True,
@@ -192,8 +206,8 @@ class MoveActionHandler(ActionHandler):
                 "name": next_location["name"],
                 "last_visited": "first_time",
                 "description": game_state.scene_description,
-                "npcs_seen": game_state.npcs_present.copy(),
-                "events_seen": game_state.events.copy(),
+                "npcs_seen": tuple(game_state.npcs_present),
+                "events_seen": tuple(game_state.events),
                 "search_results": [],  # Initialize search_results
             }
 
@@ -4,14 +4,35 @@ Error handling module.
 This module provides functionality for handling errors in the web application.
 """
 
+import functools
 import logging
-import traceback
+import sys
 from typing import Any, Dict, Optional
 
 from flask import jsonify
 
 logger = logging.getLogger(__name__)
 
+# Mensagens de erro em pt-br; "{details}" recebe os detalhes do erro.
+_MESSAGES_PT_BR: Dict[str, str] = {
+    "errors.no_active_session": "Nenhuma sessão ativa. Por favor, reinicie.",
+    "errors.no_character_found": "Nenhum personagem encontrado. Por favor, crie um novo.",
+    "errors.invalid_input": "Entrada inválida: {details}",
+    "errors.unexpected": "Ocorreu um erro inesperado: {details}",
+    "errors.action_not_found": "Ação desconhecida: {details}",
+    "errors.route_error": "Erro na rota: {details}",
+    "errors.reset_error": "Erro ao resetar o jogo: {details}",
+    "errors.reset_error_character": "Erro ao deletar dados do personagem durante o reset: {details}",
+    "errors.reset_error_game_state": "Erro ao deletar estado do jogo durante o reset: {details}",
+    # Adicione outras chaves de erro conforme necessário
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _error_message_key(error_key: str) -> str:
+    """Build (and cache) the interned message key for an error key."""
+    return sys.intern("errors." + error_key)
+
 
 class ErrorHandler:
     """
@@ -23,6 +44,9 @@ class ErrorHandler:
     - Translation support
     """
 
+    # Only static helpers; no per-instance state is ever stored.
+    __slots__ = ()
+
     @staticmethod
     def log_error(error: Exception, context: Optional[str] = None) -> None:
         """
@@ -33,8 +57,22 @@ class ErrorHandler:
             context: Optional string providing additional context about where the error occurred.
         """
         error_message = f"{context + ': ' if context else ''}{str(error)}"
-        logger.error(error_message)
-        logger.error(traceback.format_exc())
+        # Let logging format the traceback only if a handler emits the record
+        logger.error(error_message, exc_info=error)
+
+    @staticmethod
+    def failure_payload(message: str, **extra: Any) -> Dict[str, Any]:
+        """
+        Build the standard ``{"success": False, "message": ...}`` response body.
+
+        Args:
+            message: The user-facing error message.
+            **extra: Additional fields to include in the payload.
+
+        Returns:
+            A new dictionary with the failure skeleton and any extra fields.
+        """
+        return {"success": False, "message": message, **extra}
 
     @staticmethod
     def _get_error_message(
@@ -53,21 +91,10 @@ class ErrorHandler:
             The formatted error message string.
         """
         # language parameter is kept for signature compatibility but ignored.
-        messages_pt_br = {
-            "errors.no_active_session": "Nenhuma sessão ativa. Por favor, reinicie.",
-            "errors.no_character_found": "Nenhum personagem encontrado. Por favor, crie um novo.",
-            "errors.invalid_input": f"Entrada inválida: {error_details}",
-            "errors.unexpected": f"Ocorreu um erro inesperado: {error_details}",
-            "errors.action_not_found": f"Ação desconhecida: {error_details}",
-            "errors.route_error": f"Erro na rota: {error_details}",
-            "errors.reset_error": f"Erro ao resetar o jogo: {error_details}",
-            "errors.reset_error_character": f"Erro ao deletar dados do personagem durante o reset: {error_details}",
-            "errors.reset_error_game_state": f"Erro ao deletar estado do jogo durante o reset: {error_details}",
-            # Adicione outras chaves de erro conforme necessário
-        }
-        return messages_pt_br.get(
-            error_key, f"Erro desconhecido: {error_key}. Detalhes: {error_details}"
-        )
+        template = _MESSAGES_PT_BR.get(error_key)
+        if template is None:
+            return f"Erro desconhecido: {error_key}. Detalhes: {error_details}"
+        return template.format(details=error_details)
 
     @staticmethod
     def create_error_response(
@@ -87,10 +114,10 @@ class ErrorHandler:
         # language parameter is kept for signature compatibility but will be
         # 'pt-br'
         message = ErrorHandler._get_error_message(
-            f"errors.{error_key}", language, error_details
+            _error_message_key(error_key), language, error_details
         )
 
-        return jsonify({"success": False, "message": message, "error_key": error_key})
+        return jsonify(ErrorHandler.failure_payload(message, error_key=error_key))
 
     @staticmethod
     def handle_route_error(
@@ -116,8 +143,4 @@ class ErrorHandler:
         )
 
         # Create error response
-        return {
-            "success": False,
-            "message": error_message_str,
-            "error": str(e),
-        }
+        return ErrorHandler.failure_payload(error_message_str, error=str(e))
@@ -153,7 +153,16 @@ class GameEngine:
         try:
             game_state_data_to_save = game_state.to_dict()
             with open(path, "w", encoding="utf-8") as f:
-                json.dump(game_state_data_to_save, f, indent=2)
+                # Compact encoding: game states grow with the world map, and
+                # pretty-printing them roughly doubles write time and file size.
+                # ensure_ascii=False writes accented text as UTF-8 (2 bytes)
+                # instead of \uXXXX escapes (6 bytes); the file is UTF-8.
+                json.dump(
+                    game_state_data_to_save,
+                    f,
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                )
             logger.info(f"Game state for {character_id} saved successfully to {path}")
         except (
             IOError,
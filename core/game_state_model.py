@@ -12,6 +12,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     TypedDict,
 )
 
@@ -62,14 +63,19 @@ class SearchResultEntry(TypedDict):
     result: str
 
 
-class VisitedLocationDetail(TypedDict):
-    """Type definition for detailed information about a visited location."""
+class VisitedLocationDetail(TypedDict, total=False):
+    """Type definition for detailed information about a visited location.
+
+    Entries may hold only the per-visit delta (``last_visited``,
+    ``search_results``); ``GameState.get_visited`` fills in the rest from
+    ``world_map``.
+    """
 
     name: str
     last_visited: str
     description: str
-    npcs_seen: List[str]
-    events_seen: List[str]
+    npcs_seen: Sequence[str]  # Read-only snapshot (tuple) taken at the visit
+    events_seen: Sequence[str]
     search_results: List[SearchResultEntry]
 
 
@@ -84,9 +90,13 @@ class CombatState(TypedDict, total=False):
     # combat_ended: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
-    """Represents the current state of the game."""
+    """Represents the current state of the game.
+
+    Uses ``__slots__`` so attribute access skips the instance ``__dict__``; every
+    attribute the game assigns must therefore be declared as a field here.
+    """
 
     current_location: str = ""
     scene_description: str = ""
@@ -122,6 +132,18 @@ class GameState:
     current_scene_interactables: List[str] = field(
         default_factory=list
     )  # Elementos interativos na cena atual
+    quests: List[Dict[str, Any]] = field(
+        default_factory=list
+    )  # Missões ativas recebidas de NPCs
+
+    def __getstate__(self) -> tuple:
+        """Return the field values as a flat tuple for pickling and copying."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore field values from the tuple produced by ``__getstate__``."""
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert game state to a dictionary."""
@@ -149,6 +171,7 @@ class GameState:
             "summary": self.summary,
             "long_term_memory": self.long_term_memory,
             "current_scene_interactables": self.current_scene_interactables,
+            "quests": self.quests,
         }
 
     @classmethod
@@ -209,8 +232,33 @@ class GameState:
         instance.current_scene_interactables = data.get(
             "current_scene_interactables", instance.current_scene_interactables
         )
+        instance.quests = data.get("quests", instance.quests)
         return instance
 
+    def get_visited(self, loc_id: str) -> Optional[VisitedLocationDetail]:
+        """Return the visit record for a location, completed from the world map.
+
+        Args:
+            loc_id: The ID of the visited location.
+
+        Returns:
+            The ``visited_locations`` entry merged over the location's
+            ``world_map`` data, or None if the location was never visited.
+        """
+        visited = self.visited_locations.get(loc_id)
+        if visited is None:
+            return None
+        location = self.world_map.get(loc_id, {})
+        merged: VisitedLocationDetail = {
+            "name": location.get("name", ""),
+            "description": location.get("description", ""),
+            "npcs_seen": tuple(location.get("npcs", ())),
+            "events_seen": tuple(location.get("events", ())),
+            "search_results": [],
+        }
+        merged.update(visited)
+        return merged
+
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the game state's conversation history.
 
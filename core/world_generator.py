@@ -8,12 +8,162 @@ import json
 import logging
 import os
 import random
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele usa o json da biblioteca padrão
+    orjson = None
 
 from ai.openrouter import OpenRouterClient  # Corrigido o caminho e nome da classe
+from ai.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for the blocking AI requests of a location (description, NPCs and
+# events are independent, so they run concurrently instead of back to back).
+_AI_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix="world-ai")
+
+# Circuit breaker: after this many consecutive AI failures, skip the AI for
+# _BREAKER_COOLDOWN seconds and use the local fallbacks straight away.
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+
+
+# Prompts de geração: as instruções fixas vão na mensagem de sistema (um
+# prefixo idêntico em todas as chamadas) e só o local varia na mensagem do
+# usuário.
+_DESC_SYSTEM = (
+    "Você é um Mestre de RPG criando descrições de locais em um mundo "
+    "pós-apocalíptico infestado por zumbis, onde a sobrevivência é uma luta "
+    "diária. Gere descrições detalhadas e atmosféricas EM PORTUGUÊS DO BRASIL.\n"
+    "\n"
+    "A descrição deve ter 2-3 parágrafos e incluir:\n"
+    "- APARÊNCIA VISUAL: Detalhes sobre destruição, abandono, sinais de luta "
+    "(recente ou antiga), pichações de sobreviventes (avisos, pedidos de ajuda, "
+    "marcas de gangues), barricadas improvisadas (bem-sucedidas ou falhas).\n"
+    "- ATMOSFERA E SENSAÇÕES: O cheiro predominante (podridão, mofo, fumaça, "
+    "sangue seco). O silêncio opressor que pode ser quebrado por sons repentinos "
+    "e ameaçadores (o arrastar de pés de um zumbi, um choro distante, o estalar "
+    "de um galho). A sensação de estar sendo observado.\n"
+    "- PISTAS SOBRE O PASSADO: Evidências de uma luta desesperada, sinais de "
+    "evacuação apressada, barricadas falhas ou resistentes. Restos de "
+    "suprimentos (embalagens vazias, fogueiras frias, munição deflagrada). "
+    "Veículos abandonados, talvez com corpos.\n"
+    "- PERIGOS E OPORTUNIDADES IMEDIATAS: Indique sutilmente se o local parece "
+    "seguro por ora, se há sinais claros de zumbis, ou se foi pilhado. Há "
+    "cobertura óbvia? Rotas de fuga visíveis?\n"
+    "- CARACTERÍSTICA ÚNICA: Um grafite perturbador, um veículo abandonado de "
+    "forma peculiar, um perigo óbvio ou uma oportunidade sutil (porta "
+    "entreaberta para o desconhecido).\n"
+    "\n"
+    "Mantenha a descrição imersiva, focada na sobrevivência e perigo. RESPONDA "
+    "APENAS COM A DESCRIÇÃO GERADA, SEM PREFÁCIOS OU OBSERVAÇÕES."
+)
+_DESC_USER_TMPL = "Descreva o local chamado '{name}', que é um(a) '{type}'."
+
+_NPC_SYSTEM = (
+    "Você é um Mestre de RPG criando NPCs para um apocalipse zumbi. Gere o NOME "
+    "e uma BREVE DESCRIÇÃO (1 frase concisa) EM PORTUGUÊS DO BRASIL para um "
+    "personagem NPC único e interessante.\n"
+    "O personagem deve ter uma característica marcante, peculiaridade, "
+    "necessidade urgente ou história implícita que o torne memorável e "
+    "interativo (amigável, hostil, necessitado, desconfiado, etc.).\n"
+    "RESPONDA APENAS COM O NOME DO NPC, SEGUIDO DE UMA VÍRGULA E A DESCRIÇÃO.\n"
+    'Exemplo: "Corvo, um ex-militar taciturno que perdeu seu esquadrão e agora '
+    'só confia em seu rifle enferrujado." ou "Lily, uma garotinha assustada que '
+    'se agarra a um ursinho de pelúcia manchado de fuligem."'
+)
+_NPC_USER_TMPL = (
+    "Crie um NPC que poderia ser encontrado em '{name}' (um(a) '{type}')."
+)
+
+_EVENT_SYSTEM = (
+    "Você é um Mestre de RPG criando eventos ambientais para um apocalipse "
+    "zumbi. Gere uma BREVE DESCRIÇÃO (1 frase) EM PORTUGUÊS DO BRASIL para um "
+    "evento ou situação interessante e tensa.\n"
+    "O evento deve aumentar a sensação de perigo, desolação, mistério ou uma "
+    "rara oportunidade. Pode ser um som, um movimento, algo encontrado.\n"
+    "RESPONDA APENAS COM A FRASE DESCRITIVA DO EVENTO, SEM PREFÁCIOS OU "
+    "OBSERVAÇÕES."
+)
+_EVENT_USER_TMPL = "Crie um evento ocorrendo em '{name}' (um(a) '{type}')."
+
+_NPC_EVENT_SYSTEM = (
+    "Você é um Mestre de RPG criando o conteúdo de um local durante um "
+    "apocalipse zumbi. Gere, EM PORTUGUÊS DO BRASIL:\n"
+    '- "npc": o NOME e uma BREVE DESCRIÇÃO (1 frase concisa) de um personagem '
+    "NPC único e interessante, com uma característica marcante, peculiaridade, "
+    "necessidade urgente ou história implícita, no formato "
+    '"Nome, descrição".\n'
+    '- "event": uma BREVE DESCRIÇÃO (1 frase) de um evento ou situação tensa que '
+    "aumente a sensação de perigo, desolação, mistério ou uma rara "
+    "oportunidade.\n"
+    "RESPONDA APENAS COM UM OBJETO JSON, SEM PREFÁCIOS OU OBSERVAÇÕES: "
+    '{"npc": "...", "event": "..."}'
+)
+_NPC_EVENT_USER_TMPL = "Local: '{name}' (um(a) '{type}')."
+
+
+# Coordenadas de origem e resultado de _coords para locais sem coordenadas
+_ORIGIN = (0, 0, 0)
+_NO_COORDS = (None, None, None)
+
+
+def _coords(
+    location: Dict[str, Any], default: Tuple[Any, Any, Any] = _NO_COORDS
+) -> Tuple[Any, Any, Any]:
+    """
+    Return a location's coordinates as an (x, y, z) tuple.
+
+    Locations store coordinates as {"x", "y", "z"} dicts (the web map and
+    GameState read that shape); lists/tuples are accepted as well. ``default``
+    is returned when the location has no coordinates.
+    """
+    coords = location.get("coordinates")
+    if isinstance(coords, dict):
+        return (coords.get("x"), coords.get("y"), coords.get("z"))
+    if isinstance(coords, (list, tuple)) and len(coords) == 3:
+        return tuple(coords)
+    return default
+
+
+def _empty_world() -> Dict[str, Any]:
+    """Return a new, empty world map (used when no saved map can be loaded)."""
+    return {
+        "locations": {},
+        "connections": {},
+        "metadata": {"version": "1.0", "created": "procedural"},
+    }
+
+
+def _parse_json_object(response: str) -> Optional[Dict[str, Any]]:
+    """Extract the JSON object from an AI response (ignoring any text around it)."""
+    start = response.find("{")
+    end = response.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        data = json.loads(response[start : end + 1])
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _is_error_response(response: str) -> bool:
+    """Return True for the JSON error payloads the AI client returns on failure."""
+    if not response.lstrip().startswith("{"):
+        return False
+    try:
+        data = json.loads(response)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(data, dict) and data.get("success") is False
+
 
 class WorldGenerator:
     """Handles procedural generation of the game world."""
@@ -82,6 +232,63 @@ class WorldGenerator:
         "Gama",  # Militar
     ]
 
+    # Descrições prontas para biomas (sem assentamento): usadas no lugar de uma
+    # chamada à IA durante a exploração. {name} é o nome do local.
+    BIOME_DESCRIPTIONS: ClassVar[Mapping[str, List[str]]] = MappingProxyType(
+        {
+            "ruas devastadas da cidade": [
+                "{name} é um corredor de asfalto rachado entre prédios sem janelas. Carros queimados formam barricadas tortas e o vento arrasta papéis e cinzas pela rua silenciosa.",
+                "Em {name}, pichações desbotadas pedem socorro nas fachadas. Vidros quebrados estalam sob os pés e, ao longe, algo se arrasta entre os escombros.",
+                "{name} cheira a fumaça velha e podridão. Uma viatura abandonada bloqueia o cruzamento, com as portas abertas e o rádio mudo.",
+            ],
+            "zona de quarentena abandonada": [
+                "{name} ainda guarda as cercas de arame e as tendas brancas da quarentena, agora rasgadas. Placas de aviso biológico balançam no vento.",
+                "Em {name}, macas vazias e trajes de proteção largados no chão contam a história de uma evacuação que falhou.",
+                "Em {name}, contêineres empilhados formam uma muralha. Do outro lado, o silêncio é quebrado por batidas ritmadas contra o metal.",
+            ],
+            "esgotos infestados": [
+                "{name} é um túnel úmido onde a água escura corre devagar. O fedor é sufocante e ecos distantes ricocheteiam pelas paredes.",
+                "Em {name}, a lanterna revela marcas de mãos nas paredes cobertas de limo e um caminho estreito sobre a água parada.",
+                "{name} se divide em galerias escuras. Grades enferrujadas e restos de um acampamento improvisado indicam que alguém tentou viver aqui.",
+            ],
+            "rodovia destruída": [
+                "{name} é uma faixa de asfalto tomada por carros engavetados, alguns ainda com ocupantes que não se movem há muito tempo.",
+                "Em {name}, um viaduto desabado corta a estrada ao meio. Malas abertas e roupas espalhadas mostram a pressa de quem fugiu a pé.",
+                "{name} se estende vazia até o horizonte. Um posto de pedágio queimado e placas tombadas são os únicos marcos no caminho.",
+            ],
+            "floresta sombria e silenciosa": [
+                "{name} é uma mata fechada onde nenhum pássaro canta. Galhos quebrados e pegadas arrastadas marcam uma trilha recente.",
+                "Em {name}, a névoa se prende entre as árvores. Uma barraca rasgada e uma fogueira fria estão abandonadas numa clareira.",
+                "{name} engole a luz do dia. Cada estalo de galho parece alto demais, e a sensação de ser observado não passa.",
+            ],
+            "pântano contaminado": [
+                "{name} borbulha com uma água esverdeada e oleosa. Tambores de produtos químicos enferrujam semienterrados na lama.",
+                "Em {name}, o ar pesa com um cheiro ácido. Silhuetas imóveis se erguem entre os juncos, difíceis de distinguir na neblina.",
+                "{name} é um atoleiro traiçoeiro de lama e raízes. Uma canoa virada sugere que alguém tentou atravessar e não conseguiu.",
+            ],
+            "shopping center saqueado": [
+                "{name} tem vitrines estilhaçadas e prateleiras vazias. Escadas rolantes paradas levam a andares mergulhados na escuridão.",
+                "Em {name}, carrinhos de compras formam uma barricada desfeita na entrada. Cartazes de promoção desbotados contrastam com o caos.",
+                "{name} ecoa a cada passo. A praça de alimentação está revirada e um alarme distante dispara de tempos em tempos.",
+            ],
+            "hospital abandonado": [
+                "{name} cheira a antisséptico e decomposição. Corredores longos estão cobertos de prontuários espalhados e macas viradas.",
+                "Em {name}, luzes de emergência piscam sobre portas trancadas com correntes. Marcas de arranhões cobrem o lado de dentro.",
+                "{name} guarda uma farmácia saqueada e uma ala isolada por fita amarela. Gemidos abafados vêm de algum andar acima.",
+            ],
+            "complexo industrial em ruínas": [
+                "{name} é um labirinto de galpões e esteiras paradas. Correntes balançam no alto e o metal range com o vento.",
+                "Em {name}, chaminés apagadas dominam o céu cinzento. Ferramentas e peças ainda podem ser encontradas entre a sucata.",
+                "{name} tem pátios cobertos de óleo e contêineres abertos. Um portão soldado às pressas indica que alguém tentou se fortificar ali.",
+            ],
+            "área rural desolada": [
+                "{name} é um campo de plantações secas e cercas caídas. Um espantalho torto observa a estrada de terra vazia.",
+                "Em {name}, um celeiro com o telhado afundado range ao vento. Rastros de animais e de algo mais pesado cruzam a lama.",
+                "{name} se estende em pastos abandonados. Uma casa de fazenda com as janelas pregadas parece deserta, mas não inteiramente.",
+            ],
+        }
+    )
+
     def __init__(self, data_dir: str):
         """
         Initialize the world generator.
@@ -92,6 +299,116 @@ class WorldGenerator:
         self.data_dir = data_dir
         self.world_file = os.path.join(data_dir, "world_map.json")
         self.ai_client = OpenRouterClient()  # Corrigida a instanciação da classe
+        self.response_cache = ResponseCache(os.path.join(data_dir, "llm_cache"))
+        # Gerador próprio em vez do estado global compartilhado do módulo random
+        self._rng = random.Random()
+        # Circuit breaker state (see _cached_generate)
+        self._breaker_lock = threading.Lock()
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+
+    @staticmethod
+    def _find_location_id_at(
+        coords: Dict[str, int], world_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Return the ID of the first location at the given coordinates, if any.
+
+        Args:
+            coords: Coordinates dictionary with x, y, z
+            world_data: World data (location ID -> location data)
+
+        Returns:
+            The location ID, or None if no location is there
+        """
+        x, y, z = coords["x"], coords["y"], coords["z"]
+        for loc_id, loc_data in world_data.items():
+            # Ensure loc_data is a dictionary before calling .get()
+            if not isinstance(loc_data, dict):
+                logger.warning(
+                    "Skipping non-dict item in world_data: %s for ID %s",
+                    loc_data,
+                    loc_id,
+                )
+                continue
+            loc_coords = loc_data.get("coordinates")
+            if isinstance(loc_coords, dict):
+                # Common shape, compared inline to keep the scan cheap
+                if (
+                    loc_coords.get("x") == x
+                    and loc_coords.get("y") == y
+                    and loc_coords.get("z") == z
+                ):
+                    return loc_id
+            elif loc_coords is not None and _coords(loc_data) == (x, y, z):
+                return loc_id
+        return None
+
+    def _cached_generate(
+        self, prompt: str, system_prompt: str, use_cache: bool = True
+    ) -> str:
+        """
+        Send a prompt to the AI, reusing cached responses.
+
+        Cached responses are returned even while the circuit breaker is open.
+        Otherwise an open breaker, a failed request or an error payload from
+        the client raises ConnectionError, so callers use their fallbacks.
+
+        Args:
+            prompt: User message (the per-location part of the request)
+            system_prompt: Static instructions sent as the system message
+            use_cache: Whether to read and store the response in the cache;
+                pass False when every call should get a fresh response
+
+        Returns:
+            The AI response text
+
+        Raises:
+            ConnectionError: If the AI is unavailable
+        """
+        model = getattr(self.ai_client, "model", "") or ""
+        cache_text = f"{system_prompt}\n{prompt}"
+        if use_cache:
+            cached = self.response_cache.get(model, cache_text)
+            if cached is not None:
+                return cached
+
+        if time.monotonic() < self._breaker_open_until:
+            raise ConnectionError("AI temporarily disabled after repeated failures")
+
+        try:
+            response = self.ai_client.generate_response(
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ]
+            )
+        except Exception:
+            self._record_ai_failure()
+            raise
+        # O cliente devolve erros como JSON com "success": false
+        if not isinstance(response, str) or _is_error_response(response):
+            self._record_ai_failure()
+            raise ConnectionError(f"AI request failed: {response!s:.200}")
+
+        with self._breaker_lock:
+            self._breaker_failures = 0
+        if use_cache and response.strip():
+            self.response_cache.set(model, cache_text, response)
+        return response
+
+    def _record_ai_failure(self) -> None:
+        """Count a failed AI call and open the circuit breaker at the threshold."""
+        with self._breaker_lock:
+            self._breaker_failures += 1
+            if self._breaker_failures >= _BREAKER_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+                self._breaker_failures = 0
+                logger.warning(
+                    "AI failed %d times in a row; using fallbacks for %.0f s.",
+                    _BREAKER_THRESHOLD,
+                    _BREAKER_COOLDOWN,
+                )
 
     def load_world(self) -> Dict[str, Any]:
         """
@@ -102,6 +419,9 @@ class WorldGenerator:
         """
         if os.path.exists(self.world_file):
             try:
+                if orjson is not None:
+                    with open(self.world_file, "rb") as f:
+                        return orjson.loads(f.read())
                 with open(self.world_file, "r", encoding="utf-8") as f:
                     return json.load(f)
             except FileNotFoundError:
@@ -112,26 +432,43 @@ class WorldGenerator:
                 logger.error("Error loading world map: %s", e)
 
         # Return empty world if file doesn't exist or has errors
-        return {
-            "locations": {},
-            "connections": {},
-            "metadata": {"version": "1.0", "created": "procedural"},
-        }
+        return _empty_world()
 
     def save_world(self, world_data: Dict[str, Any]) -> bool:
         """
         Save the world map to file.
 
+        The map is written to a temporary file that then replaces the world
+        file, so a crash mid-write never leaves a truncated map behind.
+
         Args:
             world_data: World map dictionary
 
         Returns:
             Success status
         """
+        tmp_file = f"{self.world_file}.{threading.get_ident()}.tmp"
         try:
             os.makedirs(self.data_dir, exist_ok=True)
-            with open(self.world_file, "w", encoding="utf-8") as f:
-                json.dump(world_data, f, indent=2, ensure_ascii=False)
+            try:
+                if orjson is not None:
+                    data = orjson.dumps(
+                        world_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                    with open(tmp_file, "wb") as f:
+                        f.write(data)
+                else:
+                    with open(tmp_file, "w", encoding="utf-8") as f:
+                        json.dump(world_data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, self.world_file)
+            except BaseException:
+                # Don't leave a partial temporary file behind
+                try:
+                    os.unlink(tmp_file)
+                except OSError:
+                    pass
+                raise
             return True
         except IOError as e:
             logger.error("Error saving world map: %s", e)
@@ -147,12 +484,12 @@ class WorldGenerator:
         Returns:
             Generated name
         """
-        if random.random() < 0.7:  # 70% chance of compound name
-            prefix = random.choice(self.NAME_PREFIXES)
-            suffix = random.choice(self.NAME_SUFFIXES)
+        if self._rng.random() < 0.7:  # 70% chance of compound name
+            prefix = self._rng.choice(self.NAME_PREFIXES)
+            suffix = self._rng.choice(self.NAME_SUFFIXES)
             return f"{prefix}{suffix}"
         if not location_type:
-            location_type = random.choice(self.SETTLEMENT_TYPES)
+            location_type = self._rng.choice(self.SETTLEMENT_TYPES)
 
         adjectives = [  # Adjetivos mais temáticos
             "Abandonada",
@@ -173,13 +510,13 @@ class WorldGenerator:
             "da Zona Morta",
         ]
 
-        if random.random() < 0.5:
+        if self._rng.random() < 0.5:
             return f"{
-                random.choice(adjectives)} {
+                self._rng.choice(adjectives)} {
                 location_type.capitalize()}"
         return f"{
             location_type.capitalize()} {
-            random.choice(elements)}"
+            self._rng.choice(elements)}"
 
     def generate_starting_location(self) -> Dict[str, Any]:
         """
@@ -194,7 +531,7 @@ class WorldGenerator:
             "edifício barricado",
             "posto avançado de sobreviventes",
         ]
-        settlement_type = random.choice(possible_starts)
+        settlement_type = self._rng.choice(possible_starts)
         location_name = self.generate_location_name(settlement_type)
 
         # Generate a unique ID for the location
@@ -211,14 +548,10 @@ class WorldGenerator:
         )
         location_id = f"{base_location_id}_0_0"  # Assume starting at 0,0
 
-        # Generate description using AI - ADAPTED PROMPT
-        description = self.generate_location_description(location_name, settlement_type)
-
-        # Generate NPCs
-        npcs = self.generate_npcs(location_name, settlement_type)
-
-        # Generate events
-        events = self.generate_events(location_name, settlement_type)
+        # Generate description, NPCs and events using AI, concurrently
+        description, npcs, events = self._generate_location_content(
+            location_name, settlement_type
+        )
 
         # Create location data
         location_data = {
@@ -237,39 +570,113 @@ class WorldGenerator:
 
         return location_data
 
-    def generate_location_description(
+    def _generate_location_content(
+        self, location_name: str, location_type: str, with_npcs: bool = True
+    ) -> Tuple[str, List[str], List[str]]:
+        """
+        Generate the AI-backed content of a location concurrently.
+
+        Each generator blocks on its own AI request, so they are submitted to a
+        shared thread pool and the location waits for the slowest one instead
+        of their sum.
+
+        Args:
+            location_name: Name of the location
+            location_type: Type of location
+            with_npcs: Whether to generate NPCs for the location
+
+        Returns:
+            Tuple of (description, npcs, events)
+        """
+        description_future = _AI_EXECUTOR.submit(
+            self.generate_location_description, location_name, location_type
+        )
+        if not with_npcs:
+            events_future = _AI_EXECUTOR.submit(
+                self.generate_events, location_name, location_type
+            )
+            return description_future.result(), [], events_future.result()
+
+        # NPCs and events both need one unique AI item: ask for both at once
+        npc_event_future = _AI_EXECUTOR.submit(
+            self.generate_npc_and_event, location_name, location_type
+        )
+        npcs = self.generate_npcs(location_name, location_type, use_ai=False)
+        events = self.generate_events(location_name, location_type, use_ai=False)
+        unique_npc, unique_event = npc_event_future.result()
+        if unique_npc and unique_npc not in npcs:
+            npcs.append(unique_npc)
+        if unique_event and unique_event not in events:
+            events.append(unique_event)
+        return description_future.result(), npcs, events
+
+    def generate_npc_and_event(
         self, location_name: str, location_type: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Generate a unique NPC and a unique event for a location in one AI call.
+
+        Args:
+            location_name: Name of the location
+            location_type: Type of location
+
+        Returns:
+            Tuple of (NPC name, event description); either is None if the AI
+            did not provide it
+        """
+        try:
+            prompt = _NPC_EVENT_USER_TMPL.format(
+                name=location_name, type=location_type
+            )
+            response = self._cached_generate(prompt, _NPC_EVENT_SYSTEM)
+            data = _parse_json_object(response)
+            if data is None:
+                logger.warning("Unexpected NPC/event response: %.200s", response)
+                return None, None
+
+            npc = data.get("npc")
+            event = data.get("event")
+            unique_npc = (
+                # Apenas o nome (parte antes da primeira vírgula), como em generate_npcs
+                npc.strip().split(",", 1)[0].strip()
+                if isinstance(npc, str) and npc.strip()
+                else None
+            )
+            unique_event = (
+                event.strip().split("\n", maxsplit=1)[0]
+                if isinstance(event, str) and event.strip()
+                else None
+            )
+            return unique_npc, unique_event
+        except Exception as e:  # Fallback para outras exceções da AI
+            logger.error("Error generating unique NPC and event: %s", e)
+            return None, None
+
+    def generate_location_description(
+        self, location_name: str, location_type: str, detailed: bool = False
     ) -> str:
         """
         Generate a description for a location using AI.
 
+        Biomes with ready-made templates (BIOME_DESCRIPTIONS) skip the AI call
+        unless a detailed description is requested.
+
         Args:
             location_name: Name of the location
             location_type: Type of location
+            detailed: Always ask the AI, even for templated biomes
 
         Returns:
             Descrição gerada em Português do Brasil.
         """
-        prompt = f"""
-        Você é um Mestre de RPG criando a descrição de um local.
-        Gere uma descrição detalhada e atmosférica EM PORTUGUÊS DO BRASIL para um local chamado '{location_name}',
-        que é um(a) '{location_type}' em um mundo pós-apocalíptico infestado por zumbis, onde a sobrevivência é uma luta diária.
-
-        A descrição deve ter 2-3 parágrafos e incluir:
-        - APARÊNCIA VISUAL: Detalhes sobre destruição, abandono, sinais de luta (recente ou antiga), pichações de sobreviventes (avisos, pedidos de ajuda, marcas de gangues), barricadas improvisadas (bem-sucedidas ou falhas).
-        - ATMOSFERA E SENSAÇÕES: O cheiro predominante (podridão, mofo, fumaça, sangue seco). O silêncio opressor que pode ser quebrado por sons repentinos e ameaçadores (o arrastar de pés de um zumbi, um choro distante, o estalar de um galho). A sensação de estar sendo observado.
-        - PISTAS SOBRE O PASSADO: Evidências de uma luta desesperada, sinais de evacuação apressada, barricadas falhas ou resistentes. Restos de suprimentos (embalagens vazias, fogueiras frias, munição deflagrada). Veículos abandonados, talvez com corpos.
-        - PERIGOS E OPORTUNIDADES IMEDIATAS: Indique sutilmente se o local parece seguro por ora, se há sinais claros de zumbis, ou se foi pilhado. Há cobertura óbvia? Rotas de fuga visíveis?
-        - CARACTERÍSTICA ÚNICA: Um grafite perturbador, um veículo abandonado de forma peculiar, um perigo óbvio ou uma oportunidade sutil (porta entreaberta para o desconhecido).
-
-        Mantenha a descrição imersiva, focada na sobrevivência e perigo. RESPONDA APENAS COM A DESCRIÇÃO GERADA, SEM PREFÁCIOS OU OBSERVAÇÕES.
-        """
+        templates = self.BIOME_DESCRIPTIONS.get(location_type)
+        if templates and not detailed:
+            return self._rng.choice(templates).format(name=location_name)
+
+        prompt = _DESC_USER_TMPL.format(name=location_name, type=location_type)
 
         try:
-            prompt_dict = {"role": "user", "content": prompt}
-            response = self.ai_client.generate_response(
-                [prompt_dict]
-            )  # Envolve em uma lista
+            response = self._cached_generate(prompt, _DESC_SYSTEM)
             if isinstance(response, str) and response.strip():
                 return response.strip()
         except ConnectionError as e:  # Exemplo de exceção mais específica para rede
@@ -283,13 +690,16 @@ class WorldGenerator:
             "é opressor. Sinais de destruição e abandono são visíveis por toda parte, um testemunho sombrio dos eventos que devastaram este mundo."
         )
 
-    def generate_npcs(self, location_name: str, location_type: str) -> List[str]:
+    def generate_npcs(
+        self, location_name: str, location_type: str, use_ai: bool = True
+    ) -> List[str]:
         """
         Generate NPCs for a location.
 
         Args:
             location_name: Name of the location
             location_type: Type of location
+            use_ai: Whether to add a unique AI-generated NPC
 
         Returns:
             Lista de nomes de NPCs em Português do Brasil.
@@ -339,26 +749,15 @@ class WorldGenerator:
         )
 
         # Select 1-3 NPCs
-        num_npcs = random.randint(1, 3)
-        npcs = random.sample(npc_pool, min(num_npcs, len(npc_pool)))
+        num_npcs = self._rng.randint(1, 3)
+        npcs = self._rng.sample(npc_pool, min(num_npcs, len(npc_pool)))
+        if not use_ai:
+            return npcs
 
         # Try to generate a unique NPC using AI - ADAPTED PROMPT
         try:
-            prompt = f"""
-            Você é um Mestre de RPG criando um NPC.
-            Gere o NOME e uma BREVE DESCRIÇÃO (1 frase concisa) EM PORTUGUÊS DO BRASIL para um personagem NPC único e
-            interessante que poderia ser encontrado em '{location_name}' (um(a) '{location_type}')
-            durante um apocalipse zumbi.
-            O personagem deve ter uma característica marcante, peculiaridade, necessidade urgente ou história implícita
-            que o torne memorável e interativo (amigável, hostil, necessitado, desconfiado, etc.).
-            RESPONDA APENAS COM O NOME DO NPC, SEGUIDO DE UMA VÍRGULA E A DESCRIÇÃO.
-            Exemplo: "Corvo, um ex-militar taciturno que perdeu seu esquadrão e agora só confia em seu rifle enferrujado." ou "Lily, uma garotinha assustada que se agarra a um ursinho de pelúcia manchado de fuligem."
-            """
-
-            prompt_dict = {"role": "user", "content": prompt}
-            response = self.ai_client.generate_response(
-                [prompt_dict]
-            )  # Envolve em uma lista
+            prompt = _NPC_USER_TMPL.format(name=location_name, type=location_type)
+            response = self._cached_generate(prompt, _NPC_SYSTEM)
             if isinstance(response, str) and response.strip():
                 # A resposta esperada é "Nome, Descrição". Pegamos apenas o nome para a lista.
                 # A descrição completa (nome + descrição) pode ser usada se o sistema de NPC for mais complexo.
@@ -374,13 +773,21 @@ class WorldGenerator:
 
         return npcs
 
-    def generate_events(self, location_name: str, location_type: str) -> List[str]:
+    def generate_events(
+        self,
+        location_name: str,
+        location_type: str,
+        use_ai: bool = True,
+        use_cache: bool = True,
+    ) -> List[str]:
         """
         Generate events for a location.
 
         Args:
             location_name: Name of the location
             location_type: Type of location
+            use_ai: Whether to add a unique AI-generated event
+            use_cache: Whether the AI event may come from the response cache
 
         Returns:
             Lista de descrições de eventos em Português do Brasil.
@@ -419,23 +826,15 @@ class WorldGenerator:
         )
 
         # Select 1-2 events
-        num_events = random.randint(1, 2)
-        events = random.sample(event_pool, min(num_events, len(event_pool)))
+        num_events = self._rng.randint(1, 2)
+        events = self._rng.sample(event_pool, min(num_events, len(event_pool)))
+        if not use_ai:
+            return events
 
         # Try to generate a unique event using AI - ADAPTED PROMPT
         try:
-            prompt = f"""
-            Você é um Mestre de RPG criando um evento ambiental.
-            Gere uma BREVE DESCRIÇÃO (1 frase) EM PORTUGUÊS DO BRASIL para um evento ou situação interessante e tensa
-            ocorrendo em '{location_name}' (um(a) '{location_type}') durante um apocalipse zumbi.
-            O evento deve aumentar a sensação de perigo, desolação, mistério ou uma rara oportunidade. Pode ser um som, um movimento, algo encontrado.
-            RESPONDA APENAS COM A FRASE DESCRITIVA DO EVENTO, SEM PREFÁCIOS OU OBSERVAÇÕES.
-            """
-
-            prompt_dict = {"role": "user", "content": prompt}
-            response = self.ai_client.generate_response(
-                [prompt_dict]
-            )  # Envolve em uma lista
+            prompt = _EVENT_USER_TMPL.format(name=location_name, type=location_type)
+            response = self._cached_generate(prompt, _EVENT_SYSTEM, use_cache)
             if isinstance(response, str) and response.strip():
                 unique_event = response.strip().split("\n", maxsplit=1)[0]
                 if unique_event not in events:
@@ -465,66 +864,33 @@ class WorldGenerator:
         current_location = world_data.get(
             current_location_id, {}
         )  # Acessar diretamente
-        current_coords = current_location.get("coordinates", {"x": 0, "y": 0, "z": 0})
+        cx, cy, cz = _coords(current_location, _ORIGIN)
 
         # Determine new coordinates based on direction
-        new_coords = current_coords.copy()
-        if direction == "north":
-            new_coords["y"] += 1
-        elif direction == "south":  # Traduzido
-            new_coords["y"] -= 1
-        elif direction == "east":
-            new_coords["x"] += 1
-        elif direction == "west":
-            new_coords["x"] -= 1
+        dx, dy, dz = _DIRECTION_DELTAS.get(direction.lower(), _ORIGIN)
+        new_coords = {"x": cx + dx, "y": cy + dy, "z": cz + dz}
 
         # Check if there's already a location at these coordinates
-        for loc_id_iter, loc_data in world_data.items():  # Acessar diretamente
-            # Ensure loc_data is a dictionary before calling .get()
-            if not isinstance(loc_data, dict):
-                logger.warning(
-                    f"Skipping non-dict item in world_data: {loc_data} for ID {loc_id_iter}"
-                )
-                continue
-            loc_coords = loc_data.get("coordinates", {})
-            if (
-                loc_coords.get("x") == new_coords["x"]
-                and loc_coords.get("y") == new_coords["y"]
-                and loc_coords.get("z") == new_coords["z"]
-            ):
-                logger.info(f"Found existing location at {new_coords}: {loc_id_iter}")
-                loc_data_with_id = (
-                    loc_data.copy()
-                )  # Create a copy to avoid modifying the original in-memory world_data
-                loc_data_with_id["id"] = loc_id_iter  # Add the ID to the returned data
-                return loc_data_with_id
+        existing_id = self._find_location_id_at(new_coords, world_data)
+        if existing_id is not None:
+            logger.info(f"Found existing location at {new_coords}: {existing_id}")
+            loc_data_with_id = world_data[
+                existing_id
+            ].copy()  # Create a copy to avoid modifying the original in-memory world_data
+            loc_data_with_id["id"] = existing_id  # Add the ID to the returned data
+            return loc_data_with_id
 
         # Determine location type based on distance from origin
         distance_from_origin = abs(new_coords["x"]) + abs(new_coords["y"])
 
         if distance_from_origin <= 2:  # Mais próximo do início
-            # Áreas urbanas em ruínas, talvez alguns postos avançados
-            possible_types = [
-                self.BIOMES[0],
-                self.BIOMES[1],
-                self.SETTLEMENT_TYPES[1],
-                self.SETTLEMENT_TYPES[4],
-            ]
+            possible_types = _CLOSE_TYPES
         elif distance_from_origin <= 5:  # Distância média
-            # Mistura de ruínas, áreas industriais, talvez zonas de quarentena
-            possible_types = self.BIOMES[:4] + [
-                self.SETTLEMENT_TYPES[2],
-                self.SETTLEMENT_TYPES[5],
-                self.SETTLEMENT_TYPES[8],
-            ]
+            possible_types = _MID_TYPES
         else:
-            # Longe, áreas mais selvagens ou perigosas
-            possible_types = self.BIOMES[3:] + [
-                self.SETTLEMENT_TYPES[3],
-                self.SETTLEMENT_TYPES[9],
-            ]
+            possible_types = _FAR_TYPES
 
-        location_type = random.choice(possible_types)
+        location_type = self._rng.choice(possible_types)
 
         # Refine location_type para não ser apenas o nome do bioma se for um bioma
         # Ex: "ruas devastadas da cidade" pode ser apenas "ruas devastadas"
@@ -539,11 +905,11 @@ class WorldGenerator:
             location_name = self.generate_location_name(location_type)
         else:
             location_name = f"{
-                random.choice(
+                self._rng.choice(
                     self.NAME_PREFIXES)} {
                 location_type.capitalize().split(' ')[
                     -1]} {
-                random.choice(
+                self._rng.choice(
                     self.NAME_SUFFIXES)}"
 
         # Generate a unique ID for the location
@@ -575,14 +941,10 @@ class WorldGenerator:
             counter += 1
             location_id = f"{base_location_id}_{counter}"
 
-        # Generate description using AI
-        description = self.generate_location_description(location_name, location_type)
-
-        # Generate NPCs (only for settlements)
-        npcs = self.generate_npcs(location_name, location_type) if is_settlement else []
-
-        # Generate events
-        events = self.generate_events(location_name, location_type)
+        # Generate description, NPCs (only for settlements) and events
+        description, npcs, events = self._generate_location_content(
+            location_name, location_type, with_npcs=is_settlement
+        )
 
         # Create location data
         location_data = {
@@ -609,18 +971,7 @@ class WorldGenerator:
 
     def _get_opposite_direction(self, direction: str) -> str:
         """Get the opposite of a direction."""
-        # direction is expected to be in Portuguese
-        opposites_pt = {
-            "norte": "sul",
-            "sul": "norte",
-            "leste": "oeste",
-            "oeste": "leste",
-            # "cima": "baixo", # if you add z-axis movement
-            # "baixo": "cima",
-        }
-        return opposites_pt.get(
-            direction.lower(), "desconhecida"
-        )  # .lower() for safety
+        return _OPPOSITES.get(direction.lower(), "desconhecida")  # .lower() for safety
 
     def get_available_directions(
         self, location_id: str, world_data: Dict[str, Any]
@@ -651,12 +1002,55 @@ class WorldGenerator:
         Returns:
             Location data or None if not found
         """
-        for _, loc_data in world_data.items():  # Acessar diretamente
-            loc_coords = loc_data.get("coordinates", {})
-            if (
-                loc_coords.get("x") == coords["x"]
-                and loc_coords.get("y") == coords["y"]
-                and loc_coords.get("z") == coords["z"]
-            ):
-                return loc_data
-        return None
+        loc_id = self._find_location_id_at(coords, world_data)
+        return world_data[loc_id] if loc_id is not None else None
+
+
+# Tipos de local possíveis por faixa de distância da origem, pré-calculados
+# uma única vez em vez de a cada geração de local.
+# Perto: áreas urbanas em ruínas, talvez alguns postos avançados
+_CLOSE_TYPES = (
+    WorldGenerator.BIOMES[0],
+    WorldGenerator.BIOMES[1],
+    WorldGenerator.SETTLEMENT_TYPES[1],
+    WorldGenerator.SETTLEMENT_TYPES[4],
+)
+# Distância média: ruínas, áreas industriais, talvez zonas de quarentena
+_MID_TYPES = tuple(WorldGenerator.BIOMES[:4]) + (
+    WorldGenerator.SETTLEMENT_TYPES[2],
+    WorldGenerator.SETTLEMENT_TYPES[5],
+    WorldGenerator.SETTLEMENT_TYPES[8],
+)
+# Longe: áreas mais selvagens ou perigosas
+_FAR_TYPES = tuple(WorldGenerator.BIOMES[3:]) + (
+    WorldGenerator.SETTLEMENT_TYPES[3],
+    WorldGenerator.SETTLEMENT_TYPES[9],
+)
+
+# Deslocamento (dx, dy, dz) de cada direção. MoveActionHandler usa os nomes em
+# português; os nomes em inglês continuam aceitos.
+_DIRECTION_DELTAS = {
+    "norte": (0, 1, 0),
+    "sul": (0, -1, 0),
+    "leste": (1, 0, 0),
+    "oeste": (-1, 0, 0),
+    "north": (0, 1, 0),
+    "south": (0, -1, 0),
+    "east": (1, 0, 0),
+    "west": (-1, 0, 0),
+}
+# Direção oposta de cada direção (somente leitura)
+_OPPOSITES = MappingProxyType(
+    {
+        "norte": "sul",
+        "sul": "norte",
+        "leste": "oeste",
+        "oeste": "leste",
+        # "cima": "baixo", # if you add z-axis movement
+        # "baixo": "cima",
+        "north": "south",
+        "south": "north",
+        "east": "west",
+        "west": "east",
+    }
+)
@@ -8,10 +8,8 @@ import logging
 import os
 import sys
 
-from app.app import _game_app_instance, application
-
-# Configurar logging
-# logging.basicConfig(level=logging.INFO) # Linha original
+# Configurar logging antes de importar a aplicação, para que os logs emitidos
+# durante a inicialização de app.app já usem este nível e formato.
 log_level_str = os.environ.get("LOG_LEVEL", "INFO").upper()
 log_level = getattr(logging, log_level_str, logging.INFO)
 logging.basicConfig(
@@ -19,6 +17,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from web.logger import configure_async_logging  # noqa: E402
+
+# Escrita dos logs em thread de fundo, fora do caminho das requisições
+configure_async_logging()
+
+from app.app import _game_app_instance, application  # noqa: E402
+
 # Adiciona o diretório raiz do projeto ao path do Python
 root_dir = os.path.abspath(
     os.path.join(os.path.dirname(__file__))
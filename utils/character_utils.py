@@ -89,4 +89,6 @@ def generate_initial_inventory(
                 inventory.append(v)
                 if len(inventory) > 8:  # Limitar um pouco o inventário inicial
                     break
-    return list(set(inventory))  # Garante itens únicos e remove duplicatas se houver
+    # Garante itens únicos e remove duplicatas se houver. Sempre devolve uma
+    # lista nova, que o chamador pode usar diretamente sem copiar.
+    return list(set(inventory))
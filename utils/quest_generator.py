@@ -4,8 +4,11 @@ Quest generator module.
 This module provides functions for generating random quests.
 """
 
+import functools
 import logging
 import random
+import sys
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 # Para gerar recompensas de itens reais
@@ -89,6 +92,39 @@ QUEST_REWARD_CATEGORIES_BY_TYPE = {
     "deliver_message": ["consumable_food", "misc"],  # Recompensa por um favor
 }
 
+# Interna os tipos de missão e as chaves dos dicionários para que as buscas e
+# comparações de tipo no caminho de geração sejam feitas por identidade.
+QUEST_TYPES = tuple(sys.intern(quest_type) for quest_type in QUEST_TYPES)
+QUEST_TARGETS = {sys.intern(k): v for k, v in QUEST_TARGETS.items()}
+QUEST_REWARD_CATEGORIES_BY_TYPE = {
+    sys.intern(k): [sys.intern(category) for category in v]
+    for k, v in QUEST_REWARD_CATEGORIES_BY_TYPE.items()
+}
+
+# Categorias de recompensa por tipo de missão, pré-resolvidas para todos os
+# QUEST_TYPES para que a busca seja um acesso direto sem alocar o padrão.
+_DEFAULT_REWARD_CATEGORIES = ("consumable_food", "material_crafting")
+_REWARD_CATEGORIES = {
+    quest_type: tuple(
+        QUEST_REWARD_CATEGORIES_BY_TYPE.get(quest_type, _DEFAULT_REWARD_CATEGORIES)
+    )
+    for quest_type in QUEST_TYPES
+}
+
+# Template imutável da missão de fallback; apenas a descrição depende do local.
+_DEFAULT_QUEST_TEMPLATE = MappingProxyType(
+    {
+        "name": "Tarefa Simples de Sobrevivência",
+        "description": None,
+        "difficulty": 1,
+        "reward_gold": 10,  # Could be "caps", "scrap", etc.
+        "reward_xp": 25,
+        "reward_items": ("Uma Lata de Comida",),
+        "status": "active",
+        "progress": 0,
+    }
+)
+
 
 def generate_quest(location: str, difficulty: int = 1) -> Dict[str, Any]:
     """
@@ -101,38 +137,42 @@ def generate_quest(location: str, difficulty: int = 1) -> Dict[str, Any]:
     Returns:
         A dictionary containing the details of the generated quest.
     """
-    try:
-        # Select random quest type
-        quest_type = random.choice(QUEST_TYPES)
+    # Select random quest type
+    quest_type = random.choice(QUEST_TYPES)
 
+    try:
         # Generate quest details based on type
         location_context = QUEST_LOCATIONS_CONTEXT.get(
             location.lower(), f"em {location}"
         )  # Get specific context or generic
         quest_details = _generate_quest_details(quest_type, location_context)
-
-        # Create quest data
-        quest = {
-            "name": quest_details["name"],
-            "description": quest_details["description"],
-            "difficulty": difficulty,
-            "reward_gold": 50 * difficulty,
-            "reward_xp": 100 * difficulty,  # XP can still be a thing
-            "reward_items": _generate_quest_rewards(
-                difficulty, quest_type
-            ),  # Rewards can depend on quest type
-            "status": "active",
-            "progress": 0,
-        }
-
-        logger.info(f"Quest generated: {quest['name']}")
-        return quest
-
-    except Exception as e:
-        logger.error(f"Error generating quest: {e}")
+    except (AttributeError, KeyError) as e:
+        logger.error("Error generating quest details: %s", e)
         # Return fallback quest
         return _get_default_quest(location)
 
+    try:
+        # Rewards can depend on quest type
+        reward_items = _generate_quest_rewards(difficulty, quest_type)
+    except Exception as e:
+        logger.error("Error generating quest rewards: %s", e)
+        reward_items = []
+
+    # Create quest data
+    quest = {
+        "name": quest_details["name"],
+        "description": quest_details["description"],
+        "difficulty": difficulty,
+        "reward_gold": 50 * difficulty,
+        "reward_xp": 100 * difficulty,  # XP can still be a thing
+        "reward_items": reward_items,
+        "status": "active",
+        "progress": 0,
+    }
+
+    logger.info(f"Quest generated: {quest['name']}")
+    return quest
+
 
 def _generate_quest_details(quest_type: str, location: str) -> Dict[str, str]:
     """
@@ -147,35 +187,43 @@ def _generate_quest_details(quest_type: str, location: str) -> Dict[str, str]:
     """
     target_key = random.choice(QUEST_TARGETS[quest_type])
     target_name = target_key  # Using the key directly as we removed translations
+    target_name_cap = target_name.capitalize()
+    target_name_low = target_name.lower()
 
     # Generic quest name and description structure
     # Specific quest types can override this if needed
     # Example: "Coletar: Comida Enlatada" or "Limpar Área: Ninho de Zumbis"
-    name = f"{
-        quest_type.replace(
-            '_', ' ').capitalize()}: {
-        target_name.capitalize()}"
+    name = f"{quest_type.replace('_', ' ').capitalize()}: {target_name_cap}"
     # Example: "Precisamos de Comida Enlatada. Procure por algumas em {location}."
-    description = (
-        f"Complete a tarefa relacionada a {target_name.lower()} em {location}."
-    )
+    description = f"Complete a tarefa relacionada a {target_name_low} em {location}."
 
     # Specific adjustments for certain quest types
     if quest_type == "rescue":
-        rescued_person_type = target_name  # e.g. "Sobrevivente Preso"
-        name = f"Resgatar: {rescued_person_type.capitalize()}"
-        description = f"Alguém precisa de resgate ({
-                rescued_person_type.lower()}) em {location}."
+        # e.g. "Sobrevivente Preso"
+        name = f"Resgatar: {target_name_cap}"
+        description = f"Alguém precisa de resgate ({target_name_low}) em {location}."
 
     elif quest_type == "repair_fortify":
-        item_to_fix = target_name  # e.g. "Gerador do Abrigo"
-        name = f"Reparar: {item_to_fix.capitalize()}"
-        description = f"O {
-                item_to_fix.lower()} em {location} precisa de reparos urgentes."
+        # e.g. "Gerador do Abrigo"
+        name = f"Reparar: {target_name_cap}"
+        description = f"O {target_name_low} em {location} precisa de reparos urgentes."
 
     return {"name": name, "description": description}
 
 
+@functools.cache
+def _data_dir() -> str:
+    """
+    Resolve the item data directory relative to this file.
+
+    Returns:
+        The absolute path to the ``core/data`` directory.
+    """
+    # utils/quest_generator.py -> raiz do projeto -> core/data
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "core", "data")
+
+
 def _generate_quest_rewards(difficulty: int, quest_type: str) -> List[str]:
     """
     Generate quest rewards based on difficulty and quest type.
@@ -187,44 +235,40 @@ def _generate_quest_rewards(difficulty: int, quest_type: str) -> List[str]:
     Returns:
         A list of item names as rewards.
     """
-    # Inicializa o ItemGenerator. O path para 'data' precisa ser relativo ao local de execução
-    # ou absoluto. Assumindo que 'data' está no mesmo nível que 'core' e 'utils'.
-    # Se utils/quest_generator.py está em utils/, e data/ está em core/, o path precisa ser ajustado.
-    # Para simplificar, vamos assumir que o ItemGenerator pode encontrar seu 'data_dir'
-    # se chamado a partir de um script no diretório raiz do projeto.
-    # Se este script for chamado de dentro de 'core', o path para 'data' seria '../core/data'
-    # ou um path absoluto.
-    # Para este exemplo, vamos construir um path relativo a partir da localização deste arquivo.
-    base_dir = os.path.dirname(
-        os.path.dirname(os.path.abspath(__file__))
-    )  # REPLIT RPG/
-    data_dir_for_items = os.path.join(base_dir, "core", "data")
-    item_gen = ItemGenerator(data_dir=data_dir_for_items)
+    num_rewards = 1 + difficulty // 2
+    if num_rewards <= 0:
+        # Nenhuma recompensa: evita inicializar o ItemGenerator à toa
+        return []
+
+    # Inicializa o ItemGenerator com o diretório de dados resolvido uma única vez
+    item_gen = ItemGenerator(data_dir=_data_dir())
 
     reward_items_generated: List[Dict[str, Any]] = []
-    num_rewards = 1 + difficulty // 2
+
+    # A dificuldade da missão influencia o 'level' do item gerado
+    item_level_for_generation = max(1, difficulty)
 
     # Determina categorias de itens apropriadas para o tipo de missão
-    reward_categories = QUEST_REWARD_CATEGORIES_BY_TYPE.get(
-        quest_type, ["consumable_food", "material_crafting"]
-    )
+    reward_categories = _REWARD_CATEGORIES.get(quest_type, _DEFAULT_REWARD_CATEGORIES)
+
+    # Referências locais evitam a busca de atributo a cada iteração
+    rnd_choice = random.choice
+    generate_consumable = item_gen.generate_consumable
 
     for _ in range(num_rewards):
         # Seleciona uma categoria de recompensa aleatória apropriada para o tipo de missão
-        chosen_category = random.choice(reward_categories)
+        chosen_category = rnd_choice(reward_categories)
         item: Optional[Dict[str, Any]] = None
 
         # Tenta gerar um item da categoria escolhida
         # O ItemGenerator já lida com raridade internamente com base em suas chances
-        # A dificuldade da missão pode influenciar o 'level' do item gerado
-        item_level_for_generation = max(1, difficulty)
 
         if chosen_category == "weapon":
             item = item_gen.generate_weapon(level=item_level_for_generation)
         elif chosen_category == "protection":
             item = item_gen.generate_protection(level=item_level_for_generation)
         elif chosen_category.startswith("consumable_"):
-            item = item_gen.generate_consumable(
+            item = generate_consumable(
                 level=item_level_for_generation, consumable_category=chosen_category
             )
         elif chosen_category == "tool":
@@ -233,7 +277,7 @@ def _generate_quest_rewards(difficulty: int, quest_type: str) -> List[str]:
             item = item_gen.generate_material_crafting(level=item_level_for_generation)
         elif chosen_category == "ammo":
             # Gerar um tipo de munição específico ou um item "pacote de munição"
-            item = item_gen.generate_consumable(
+            item = generate_consumable(
                 level=item_level_for_generation, consumable_category="ammo"
             )  # Supondo que 'ammo' é um tipo de consumível
         elif (
@@ -264,13 +308,10 @@ def _get_default_quest(location: str) -> Dict[str, Any]:
     Returns:
         A dictionary representing a default fallback quest.
     """
-    return {
-        "name": "Tarefa Simples de Sobrevivência",
-        "description": f"Ajude com o que for preciso em {location} para sobreviver mais um dia.",
-        "difficulty": 1,
-        "reward_gold": 10,  # Could be "caps", "scrap", etc.
-        "reward_xp": 25,
-        "reward_items": ["Uma Lata de Comida"],
-        "status": "active",
-        "progress": 0,
-    }
+    quest = dict(_DEFAULT_QUEST_TEMPLATE)
+    quest["description"] = (
+        f"Ajude com o que for preciso em {location} para sobreviver mais um dia."
+    )
+    # Lista nova a cada chamada para que o chamador possa modificá-la.
+    quest["reward_items"] = list(_DEFAULT_QUEST_TEMPLATE["reward_items"])
+    return quest
@@ -5,10 +5,24 @@ This module re-exports selected utility functions from other modules within the
 utils package. This can be useful for creating a simplified access point to
 commonly used utilities or for maintaining backward compatibility if functions
 are moved around.
+
+Re-exported names are resolved lazily (PEP 562), so the backing module is only
+imported the first time one of its functions is accessed.
 """
 
-# Re-export all functions from the utils package
-from utils.dice import calculate_attribute_modifier, roll_dice
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Static bindings for linters and type checkers; at runtime the names are
+    # resolved by __getattr__ below.
+    from utils.dice import calculate_attribute_modifier, roll_dice
+
+# Maps each re-exported name to the module that defines it
+_LAZY_EXPORTS = {
+    "roll_dice": "utils.dice",
+    "calculate_attribute_modifier": "utils.dice",
+}
 
 # Export all functions for backward compatibility
 # Only list functions that are actually intended to be exported from this top-level utils.py
@@ -16,3 +30,18 @@ __all__ = [
     "roll_dice",
     "calculate_attribute_modifier",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported function on first access and cache it on the module."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazily exported names in ``dir()`` output."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,24 +1,66 @@
+import functools
 import logging
-from typing import Any, Dict, List, Union  # Added List, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Tuple, Union  # Added List, Union
 
 # Import Character model and CombatStats
 from core.models import Character, CombatStats
+from utils.character_utils import calculate_initial_gold, generate_initial_inventory
 
 logger = logging.getLogger(__name__)
 
+# Core stats read from the character form
+_CORE_STAT_NAMES: Tuple[str, ...] = (
+    "strength",
+    "dexterity",
+    "constitution",
+    "intelligence",
+    "wisdom",
+    "charisma",
+)
+# Each core stat paired with the CombatStats default used when the form value
+# is missing or invalid.
+_CORE_STAT_DEFAULTS: Tuple[Tuple[str, int], ...] = tuple(
+    (stat_name, CombatStats.__dataclass_fields__[stat_name].default)
+    for stat_name in _CORE_STAT_NAMES
+)
+# Every key written into combat_stats_data by create_character_from_form
+_COMBAT_STATS_DATA_KEYS: Tuple[str, ...] = _CORE_STAT_NAMES + (
+    "max_hp",
+    "current_hp",
+    "max_stamina",
+    "current_stamina",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _calc_max_hp(hit_die: int, constitution: int, level: int) -> int:
+    """Compute max HP for a hit die, constitution score and level (memoized)."""
+    mod_const = (constitution - 10) // 2
+    # Full hit die at level 1, then the average roll plus modifier per level
+    per_level = (hit_die // 2) + 1 + mod_const
+    max_hp = hit_die + mod_const + (level - 1) * per_level
+    return max(1, max_hp)
+
 
 class CharacterManager:
+    """Builds new survivor characters from submitted character-creation forms."""
+
     # ATTRIBUTE_DEFAULTS for "int" (core stats) is no longer needed here.
     # Defaults for core stats like strength, dexterity, etc., are handled by:
     # 1. The HTML form inputs in character.html (which default to "8").
     # 2. The Character model in models.py (which defaults to 10 if not provided).
-    ATTRIBUTE_DEFAULTS = {
-        "str": {  # Default name if not provided
-            "name": "Survivor",
-        },
-    }
+    # Read-only so callers cannot mutate the shared defaults.
+    ATTRIBUTE_DEFAULTS = MappingProxyType(
+        {
+            "str": MappingProxyType(
+                {  # Default name if not provided
+                    "name": "Survivor",
+                }
+            ),
+        }
+    )
 
-    # CLASS_HIT_DICE REMOVIDO
     DEFAULT_HIT_DIE = 8  # Todos os sobreviventes começam com um "dado de vida" base
 
     @staticmethod
@@ -26,26 +68,12 @@ class CharacterManager:
         constitution: int, level: int
     ) -> int:
         level = max(1, level)
-        # hit_die = CharacterManager.CLASS_HIT_DICE.get(
-        #     character_class, 8
-        # ) # REMOVIDO
-        hit_die = CharacterManager.DEFAULT_HIT_DIE
-        mod_const = (constitution - 10) // 2
-        max_hp = hit_die + mod_const
-        for _ in range(2, level + 1):
-            avg = (hit_die // 2) + 1
-            max_hp += avg + mod_const
-        return max(1, max_hp)
+        return _calc_max_hp(CharacterManager.DEFAULT_HIT_DIE, constitution, level)
 
     @classmethod
     def create_character_from_form(
         cls, character_data: Dict[str, Any], owner_session_id: str
     ) -> "Character":
-        from utils.character_utils import (
-            calculate_initial_gold,
-            generate_initial_inventory,
-        )
-
         # 1. Get direct Character fields or set defaults for a new character
         name_val = character_data.get("name", cls.ATTRIBUTE_DEFAULTS["str"]["name"])
         description_val = character_data.get(
@@ -54,74 +82,69 @@ class CharacterManager:
         level_val = 1  # New characters always start at level 1
 
         # 2. Initialize data for CombatStats
-        combat_stats_data: Dict[str, Any] = {}
-
-        core_stat_names = [
-            "strength",
-            "dexterity",
-            "constitution",
-            "intelligence",
-            "wisdom",
-            "charisma",
-        ]
-        for stat_name in core_stat_names:
-            form_value_str = character_data.get(stat_name)
+        # Pre-sized with every key assigned below, avoiding resizes as it fills
+        combat_stats_data: Dict[str, Any] = dict.fromkeys(_COMBAT_STATS_DATA_KEYS)
+        int_parse = int  # Local binding: LOAD_FAST instead of a builtins lookup
+        data_get = character_data.get
+
+        for stat_name, default_stat_val in _CORE_STAT_DEFAULTS:
+            stat_val = default_stat_val
+            form_value_str = data_get(stat_name)
+            if type(form_value_str) is int:
+                # Already typed (e.g. JSON/API callers): nothing to parse
+                combat_stats_data[stat_name] = form_value_str
+                continue
+            if form_value_str and form_value_str.isdecimal():
+                # Fast path: plain unsigned number, as sent by the form inputs
+                combat_stats_data[stat_name] = int_parse(form_value_str)
+                continue
             if (
                 form_value_str is not None and form_value_str.strip()
             ):  # Check if not None and not empty string
                 try:
-                    combat_stats_data[stat_name] = int(form_value_str)
+                    stat_val = int_parse(form_value_str)
                 except (ValueError, TypeError):
                     logger.warning(
-                        f"Invalid value for {stat_name} from form: '{form_value_str}'. "
-                        f"CombatStats default will be used."
+                        "Invalid value for %s from form: '%s'. "
+                        "CombatStats default will be used.",
+                        stat_name,
+                        form_value_str,
                     )
-            # If form_value_str is None or invalid, CombatStats.from_dict will use its defaults.
+            combat_stats_data[stat_name] = stat_val
+
+        # Core stats feeding the derived values, read once
+        strength_val = combat_stats_data["strength"]
+        dexterity_val = combat_stats_data["dexterity"]
+        constitution_val = combat_stats_data["constitution"]
+        intelligence_val = combat_stats_data["intelligence"]
 
         # 3. Calculate derived attributes (HP, Stamina) for CombatStats
-        constitution_for_hp_calc = combat_stats_data.get(
-            "constitution", 10
-        )  # Use value from form or default 10
-        max_hp_val = cls.calculate_max_hp_survivor(constitution_for_hp_calc, level_val)
-        combat_stats_data["max_hp"] = max_hp_val
-        combat_stats_data["current_hp"] = max_hp_val
-
-        dexterity_for_stamina_calc = combat_stats_data.get("dexterity", 10)
-        constitution_for_stamina_calc = combat_stats_data.get("constitution", 10)
+        max_hp_val = cls.calculate_max_hp_survivor(constitution_val, level_val)
+
         stamina_base = 10
-        dex_mod_stamina = (dexterity_for_stamina_calc - 10) // 2
-        con_mod_stamina = (constitution_for_stamina_calc - 10) // 2
-        max_stamina_val = max(
-            1,
-            stamina_base
-            + (dex_mod_stamina * level_val)
-            + (con_mod_stamina * level_val),
+        dex_mod = (dexterity_val - 10) // 2
+        con_mod = (constitution_val - 10) // 2
+        max_stamina_val = max(1, stamina_base + (dex_mod + con_mod) * level_val)
+
+        combat_stats_data.update(
+            max_hp=max_hp_val,
+            current_hp=max_hp_val,
+            max_stamina=max_stamina_val,
+            current_stamina=max_stamina_val,
         )
-        combat_stats_data["max_stamina"] = max_stamina_val
-        combat_stats_data["current_stamina"] = max_stamina_val
 
-        # Create CombatStats instance
-        combat_stats_obj = CombatStats.from_dict(combat_stats_data)
-
-        # Other direct fields
-        # These will be passed directly to the Character constructor
-        description_val = description_val
-        experience_val = 0
-        gold_val = calculate_initial_gold()
+        # Create CombatStats instance. combat_stats_data only holds CombatStats
+        # fields, so it can be passed straight to the constructor.
+        combat_stats_obj = CombatStats(**combat_stats_data)
 
         # 4. Generate initial inventory
-        strength_for_inv_calc = combat_stats_data.get("strength", 10)
-        dexterity_for_inv_calc = combat_stats_data.get("dexterity", 10)
-        intelligence_for_inv_calc = combat_stats_data.get("intelligence", 10)
-        generated_inventory_items = generate_initial_inventory(
-            strength_for_inv_calc,
-            dexterity_for_inv_calc,
-            intelligence_for_inv_calc,
+        # generate_initial_inventory always builds a new list, no copy needed
+        inventory_val: List[Union[str, Dict[str, Any]]] = generate_initial_inventory(
+            strength_val,
+            dexterity_val,
+            intelligence_val,
             description_val,
         )
-        inventory_val: List[Union[str, Dict[str, Any]]] = list(
-            generated_inventory_items
-        )
 
         # 5. Create the Character object
         return Character(
@@ -129,8 +152,8 @@ class CharacterManager:
             level=level_val,
             owner_session_id=owner_session_id,  # Use the owner_session_id passed as an argument
             description=description_val,
-            experience=experience_val,
-            gold=gold_val,
+            experience=0,
+            gold=calculate_initial_gold(),
             inventory=inventory_val,
             stats=combat_stats_obj,
             # survival_stats will use default_factory from Character model
@@ -4,9 +4,26 @@ Configuration module.
 This module provides functionality for configuring the web application.
 """
 
+import functools
 import os
 from typing import Any, Dict
 
+_TRUTHY = frozenset(("true", "1", "t"))
+
+# Fallback secret key, generated once per process when SECRET_KEY is unset
+_DEFAULT_SECRET_KEY = os.urandom(24).hex()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_app_config() -> Dict[str, Any]:
+    """Read the application configuration from the environment (once per process)."""
+    return {
+        "host": os.environ.get("FLASK_HOST", "127.0.0.1"),
+        "port": int(os.environ.get("FLASK_PORT", 5000)),
+        "debug": os.environ.get("FLASK_DEBUG", "True").lower() in _TRUTHY,
+        "threaded": True,
+    }
+
 
 class Config:
     """
@@ -23,16 +40,13 @@ class Config:
         """
         Get application configuration from environment variables with sensible defaults.
 
+        The environment is read once per process; later calls reuse that result.
+
         Returns:
             Dictionary with application configuration
         """
-        return {
-            "host": os.environ.get("FLASK_HOST", "127.0.0.1"),
-            "port": int(os.environ.get("FLASK_PORT", 5000)),
-            "debug": os.environ.get("FLASK_DEBUG", "True").lower()
-            in ("true", "1", "t"),
-            "threaded": True,
-        }
+        # Copy so callers can adjust their config without touching the cache
+        return dict(_load_app_config())
 
     @staticmethod
     def configure_flask_app(app):
@@ -46,7 +60,7 @@ class Config:
         app.config["SESSION_TYPE"] = os.environ.get("SESSION_TYPE", "filesystem")
 
         # Security settings
-        app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", os.urandom(24).hex())
+        app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY") or _DEFAULT_SECRET_KEY
 
         # Other settings
         app.config["JSON_SORT_KEYS"] = False
@@ -4,13 +4,160 @@ Game state management module.
 This module provides functionality for managing game state.
 """
 
+import functools
 import logging
+import pickle
+import pickletools
+from types import MappingProxyType
 from typing import Optional
 
 from core.game_state_model import GameState  # Direct import
 
 logger = logging.getLogger(__name__)
 
+# Immutable templates for a new game; create_initial_game_state deep-copies
+# the mutable parts so every character gets independent state.
+_INITIAL_LOCATION_NAME = "Abrigo Subterrâneo"
+_INITIAL_LOCATION_ID = "bunker_main"  # Set the initial location ID
+_INITIAL_COORDINATES = MappingProxyType({"x": 0, "y": 0, "z": 0})
+_INITIAL_SCENE_DESCRIPTION = "Você está na sala principal de um abrigo subterrâneo improvisado. As paredes de concreto são úmidas e a única luz vem de algumas lâmpadas de emergência piscando. Há um portão de metal reforçado ao norte que leva à superfície, uma enfermaria improvisada a leste e um depósito de suprimentos a oeste."
+
+_INITIAL_NPCS = (
+    "Velho Sobrevivente Cansado",
+    "Médica de Campo Apavorada",
+)
+_INITIAL_EVENTS = (
+    # Estes eventos são definidos aqui para a cena inicial.
+    # O GameEngine os usará ao carregar esta localização.
+    # Se a IA retornar novos eventos, o GameEngine os atualizará.
+    # A IA também pode narrar sobre estes eventos iniciais.
+    "Ouve-se o gotejar constante de água em algum lugar próximo.",
+    "Um gerador falha e a luz pisca antes de voltar.",
+)
+_INITIAL_MESSAGES = (
+    {
+        "role": "assistant",
+        "content": "Você acorda no abrigo. O mundo lá fora mudou. Sobreviva.",
+    },
+)
+
+# Initial world map with the starting location and its surroundings
+_INITIAL_WORLD_MAP = MappingProxyType(
+    {
+        "bunker_main": {
+            "name": "Abrigo Subterrâneo - Principal",
+            "type": "bunker_hub",
+            "description": _INITIAL_SCENE_DESCRIPTION,
+            "coordinates": {"x": 0, "y": 0, "z": 0},
+            "visited": True,
+            "connections": {
+                "norte": "bunker_exit_tunnel",  # Saída para a superfície
+                "leste": "bunker_infirmary",
+                "oeste": "bunker_storage",
+            },
+            "events": list(_INITIAL_EVENTS),  # Events for this specific location
+            "npcs": list(_INITIAL_NPCS),  # NPCs for this specific location
+        },
+        "bunker_exit_tunnel": {
+            "name": "Túnel de Saída do Abrigo",
+            "type": "bunker_tunnel",
+            "description": "Um túnel estreito e úmido que leva para fora do abrigo. Detritos bloqueiam parcialmente o caminho.",
+            "coordinates": {"x": 0, "y": 1, "z": 0},
+            "visited": False,
+            "connections": {
+                "sul": "bunker_main",
+                "norte": "ruined_street_01",
+            },  # Leva para a rua
+            "events": [],
+            "npcs": [],
+        },
+        "bunker_infirmary": {
+            "name": "Enfermaria do Abrigo",
+            "type": "bunker_room",
+            "description": "Uma pequena sala convertida em enfermaria. Há algumas camas improvisadas e suprimentos médicos escassos.",
+            "coordinates": {"x": 1, "y": 0, "z": 0},
+            "visited": False,
+            "connections": {"oeste": "bunker_main"},
+            "events": [],
+            "npcs": ["Médica de Campo Apavorada"],  # Example if this NPC is primarily here
+        },
+        "bunker_storage": {
+            "name": "Depósito do Abrigo",
+            "type": "bunker_room",
+            "description": "Uma área de armazenamento com prateleiras, a maioria vazias ou com itens inúteis. O ar está pesado com o cheiro de mofo.",
+            "coordinates": {"x": -1, "y": 0, "z": 0},
+            "visited": False,
+            "connections": {"leste": "bunker_main"},
+            "events": [],
+            "npcs": [],
+        },
+        # Example of an outside location
+        "ruined_street_01": {
+            "name": "Rua Devastada Próxima ao Abrigo",
+            "type": "urban_ruins",
+            "description": "Os restos de uma rua outrora movimentada. Carros destruídos e escombros de edifícios bloqueiam grande parte do caminho. O silêncio é perturbador.",
+            # Assuming surface is y=2
+            "coordinates": {"x": 0, "y": 2, "z": 0},
+            "visited": False,
+            "connections": {"sul": "bunker_exit_tunnel"},
+            "events": ["Um corvo solitário grasna de cima de um poste torto."],
+            "npcs": [],
+        },
+    }
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _initial_game_state_template() -> GameState:
+    """
+    Build the shared initial GameState template (once per process).
+
+    The template shares data with the module-level constants and must never be
+    mutated; GameStateManager.create_initial_game_state hands out copies
+    unpickled from _initial_game_state_blob.
+    """
+    game_state = GameState()
+
+    # Set initial location with unique name and coordinates
+    game_state.current_location = _INITIAL_LOCATION_NAME
+    game_state.location_id = _INITIAL_LOCATION_ID
+    game_state.coordinates = dict(_INITIAL_COORDINATES)
+    game_state.scene_description = _INITIAL_SCENE_DESCRIPTION
+
+    # Set NPCs and environmental elements
+    game_state.npcs_present = list(_INITIAL_NPCS)
+    game_state.events = list(_INITIAL_EVENTS)
+
+    # Set welcome message in the new format
+    game_state.messages = list(_INITIAL_MESSAGES)
+
+    # Initialize world map with the starting location
+    game_state.world_map = dict(_INITIAL_WORLD_MAP)
+
+    # Mark the starting location as visited. Only the per-visit delta is
+    # stored; name, description, NPCs and events come from world_map via
+    # GameState.get_visited.
+    game_state.visited_locations = {
+        _INITIAL_LOCATION_ID: {
+            "last_visited": "initial",
+            "search_results": [],  # Initialize search_results
+        }
+    }
+    return game_state
+
+
+@functools.lru_cache(maxsize=1)
+def _initial_game_state_blob() -> bytes:
+    """
+    Pickle the initial GameState template once per process.
+
+    Unpickling this blob yields a fully independent copy and is several times
+    faster than ``copy.deepcopy`` of the template.
+    """
+    return pickletools.optimize(
+        pickle.dumps(_initial_game_state_template(), pickle.HIGHEST_PROTOCOL)
+    )
+
 
 class GameStateManager:
     """
@@ -30,116 +177,8 @@ class GameStateManager:
         Returns:
             GameState: A newly initialized game state
         """
-        game_state = GameState()
-
-        # Set initial location with unique name and coordinates
-        game_state.current_location = "Abrigo Subterrâneo"
-        game_state.location_id = "bunker_main"  # Set the initial location ID
-        game_state.coordinates = {"x": 0, "y": 0, "z": 0}
-        game_state.scene_description = "Você está na sala principal de um abrigo subterrâneo improvisado. As paredes de concreto são úmidas e a única luz vem de algumas lâmpadas de emergência piscando. Há um portão de metal reforçado ao norte que leva à superfície, uma enfermaria improvisada a leste e um depósito de suprimentos a oeste."
-
-        # Set NPCs and environmental elements
-        game_state.npcs_present = [
-            "Velho Sobrevivente Cansado",
-            "Médica de Campo Apavorada",
-        ]
-        game_state.events = [
-            # Estes eventos são definidos aqui para a cena inicial.
-            # O GameEngine os usará ao carregar esta localização.
-            # Se a IA retornar novos eventos, o GameEngine os atualizará.
-            # A IA também pode narrar sobre estes eventos iniciais.
-            "Ouve-se o gotejar constante de água em algum lugar próximo.",
-            "Um gerador falha e a luz pisca antes de voltar.",
-        ]
-
-        # Set welcome message in the new format
-        game_state.messages = [
-            {
-                "role": "assistant",
-                "content": "Você acorda no abrigo. O mundo lá fora mudou. Sobreviva.",
-            }
-        ]
-
-        # Initialize world map with the starting location
-        game_state.world_map = {
-            "bunker_main": {
-                "name": "Abrigo Subterrâneo - Principal",
-                "type": "bunker_hub",
-                "description": game_state.scene_description,  # Use the already set scene description
-                "coordinates": {"x": 0, "y": 0, "z": 0},
-                "visited": True,
-                "connections": {
-                    "norte": "bunker_exit_tunnel",  # Saída para a superfície
-                    "leste": "bunker_infirmary",
-                    "oeste": "bunker_storage",
-                },
-                "events": game_state.events.copy(),  # Events for this specific location
-                "npcs": game_state.npcs_present.copy(),  # NPCs for this specific location
-            },
-            "bunker_exit_tunnel": {
-                "name": "Túnel de Saída do Abrigo",
-                "type": "bunker_tunnel",
-                "description": "Um túnel estreito e úmido que leva para fora do abrigo. Detritos bloqueiam parcialmente o caminho.",
-                "coordinates": {"x": 0, "y": 1, "z": 0},
-                "visited": False,
-                "connections": {
-                    "sul": "bunker_main",
-                    "norte": "ruined_street_01",
-                },  # Leva para a rua
-                "events": [],
-                "npcs": [],
-            },
-            "bunker_infirmary": {
-                "name": "Enfermaria do Abrigo",
-                "type": "bunker_room",
-                "description": "Uma pequena sala convertida em enfermaria. Há algumas camas improvisadas e suprimentos médicos escassos.",
-                "coordinates": {"x": 1, "y": 0, "z": 0},
-                "visited": False,
-                "connections": {"oeste": "bunker_main"},
-                "events": [],
-                "npcs": [
-                    "Médica de Campo Apavorada"
-                ],  # Example if this NPC is primarily here
-            },
-            "bunker_storage": {
-                "name": "Depósito do Abrigo",
-                "type": "bunker_room",
-                "description": "Uma área de armazenamento com prateleiras, a maioria vazias ou com itens inúteis. O ar está pesado com o cheiro de mofo.",
-                "coordinates": {"x": -1, "y": 0, "z": 0},
-                "visited": False,
-                "connections": {"leste": "bunker_main"},
-                "events": [],
-                "npcs": [],
-            },
-            # Example of an outside location
-            "ruined_street_01": {
-                "name": "Rua Devastada Próxima ao Abrigo",
-                "type": "urban_ruins",
-                "description": "Os restos de uma rua outrora movimentada. Carros destruídos e escombros de edifícios bloqueiam grande parte do caminho. O silêncio é perturbador.",
-                # Assuming surface is y=2
-                "coordinates": {"x": 0, "y": 2, "z": 0},
-                "visited": False,
-                "connections": {"sul": "bunker_exit_tunnel"},
-                "events": ["Um corvo solitário grasna de cima de um poste torto."],
-                "npcs": [],
-            },
-        }
-
-        # Mark the starting location as visited
-        # This section might be redundant if bunker_main in world_map already has visited=True
-        # and its description, npcs, events are correctly set there.
-        # However, ensuring visited_locations is correctly initialized is good.
-        game_state.visited_locations = {
-            "bunker_main": {
-                "name": "Abrigo Subterrâneo - Principal",
-                "last_visited": "initial",
-                "description": game_state.scene_description,
-                "npcs_seen": game_state.npcs_present.copy(),
-                "events_seen": game_state.events.copy(),
-                "search_results": [],  # Initialize search_results
-            }
-        }
-
+        # Unpickle the cached template so callers get fully independent state
+        game_state = pickle.loads(_initial_game_state_blob())
         logger.info("Created initial game state.")
         return game_state
 
@@ -158,11 +197,8 @@ class GameStateManager:
         game_state = game_engine.load_game_state(user_id)
 
         if game_state:
-            logger.debug(
-                # Language attribute might not exist anymore
-                f"Loaded game state for user {user_id[:8]}..."
-            )
+            logger.debug("Loaded game state for user %.8s...", user_id)
         else:
-            logger.warning(f"No game state found for user {user_id[:8]}...")
+            logger.warning("No game state found for user %.8s...", user_id)
 
         return game_state
@@ -4,11 +4,58 @@ Logging module.
 This module provides functionality for logging game actions.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Background listener started by configure_async_logging (None until then)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Numeric logging level for each supported ``level`` argument
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+def configure_async_logging() -> None:
+    """
+    Move the root logger's handlers behind a queue serviced by a background thread.
+
+    Call after ``logging.basicConfig``: the handlers it installed keep their
+    level and format, but run on a ``QueueListener`` thread. The calling
+    thread still merges the message arguments and any exception traceback into
+    the record (``QueueHandler.prepare``) before enqueueing it; the handlers'
+    own formatting and the I/O happen on the listener. Calling it again is a
+    no-op.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler()]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    # Flush queued records on interpreter exit
+    atexit.register(_queue_listener.stop)
+
 
 class GameLogger:
     """
@@ -20,6 +67,9 @@ class GameLogger:
     - Multi-level logging
     """
 
+    # Only static helpers; no per-instance state is ever stored.
+    __slots__ = ()
+
     @staticmethod
     def log_game_action(
         action: str,
@@ -36,18 +86,26 @@ class GameLogger:
             user_id: Optional user ID for context
             level: Log level ('debug', 'info', 'warning', 'error', 'critical')
         """
+        level_no = _LOG_LEVELS.get(level.lower(), logging.INFO)
+
+        # Skip building the message when this level is filtered out
+        if not logger.isEnabledFor(level_no):
+            return
+
         # Build the log message
-        message_parts = [f"Action: {action}"]
+        if not details and not user_id:
+            log_message = f"Action: {action}"
+        else:
+            message_parts = [f"Action: {action}"]
 
-        if details:
-            message_parts.append(f"Details: {details}")
+            if details:
+                message_parts.append(f"Details: {details}")
 
-        if user_id:
-            # Only show part of the ID for privacy
-            message_parts.append(f"User: {user_id[:8]}...")
+            if user_id:
+                # Only show part of the ID for privacy
+                message_parts.append(f"User: {user_id[:8]}...")
 
-        log_message = " | ".join(message_parts)
+            log_message = " | ".join(message_parts)
 
         # Log at the appropriate level
-        log_method = getattr(logger, level.lower(), logger.info)
-        log_method(log_message)
+        logger.log(level_no, log_message)
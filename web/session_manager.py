@@ -5,13 +5,19 @@ This module provides functionality for managing user sessions.
 """
 
 import logging
-import os
-from typing import Any, Dict, Optional
+import secrets
+from typing import Any, Dict, Final, Optional
 
 from flask import session
 
 logger = logging.getLogger(__name__)
 
+# The game only ships Brazilian Portuguese content
+DEFAULT_LANGUAGE: Final[str] = "pt-br"
+
+# Keys the application stores in the Flask session
+_SESSION_KEYS = ("user_id", "language", "active_character_id")
+
 
 class SessionManager:
     """
@@ -23,6 +29,9 @@ class SessionManager:
     - Session initialization and validation
     """
 
+    # Only static helpers; no per-instance state is ever stored.
+    __slots__ = ()
+
     @staticmethod
     def ensure_session_initialized() -> str:
         """
@@ -33,13 +42,13 @@ class SessionManager:
         """
         # Generate a user ID if not exists
         if "user_id" not in session:
-            session["user_id"] = os.urandom(16).hex()
-            logger.debug(f"Generated new user ID: {session['user_id'][:8]}...")
+            session["user_id"] = secrets.token_hex(16)
+            logger.debug("Generated new user ID: %.8s...", session["user_id"])
 
         # Set default language if not set
         if "language" not in session:
-            session["language"] = "pt-br"  # Hardcode to pt-br
-            logger.debug(f"Set default language: {session['language']}")
+            session["language"] = DEFAULT_LANGUAGE
+            logger.debug("Set default language: %s", session["language"])
 
         return session["user_id"]
 
@@ -61,7 +70,7 @@ class SessionManager:
         Returns:
             str: Language code
         """
-        return "pt-br"  # Always return pt-br
+        return DEFAULT_LANGUAGE
 
     @staticmethod
     def set_language(language: str) -> None:
@@ -72,9 +81,11 @@ class SessionManager:
             language: Language code
         """
         # Language is now fixed, so this method might be deprecated or do nothing.
-        # session["language"] = "pt-br" # Or simply remove its usage
+        # session["language"] = DEFAULT_LANGUAGE # Or simply remove its usage
         logger.debug(
-            f"Attempted to set language to: {language}, but language is fixed to pt-br."
+            "Attempted to set language to: %s, but language is fixed to %s.",
+            language,
+            DEFAULT_LANGUAGE,
         )
 
     @staticmethod
@@ -85,8 +96,8 @@ class SessionManager:
         Returns:
             str: New user ID
         """
-        session["user_id"] = os.urandom(16).hex()
-        logger.debug(f"Regenerated user ID: {session['user_id'][:8]}...")
+        session["user_id"] = secrets.token_hex(16)
+        logger.debug("Regenerated user ID: %.8s...", session["user_id"])
         return session["user_id"]
 
     @staticmethod
@@ -97,4 +108,6 @@ class SessionManager:
         Returns:
             Dict: Session data
         """
-        return dict(session)
+        # Copy only the keys the application stores instead of walking the
+        # whole session mapping
+        return {key: session[key] for key in _SESSION_KEYS if key in session}